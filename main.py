@@ -1,86 +1,206 @@
 import sys
 import os
-import re
 import sqlite3
 import json
+import hashlib
+import hmac
+import bisect
+import collections
 import io
 import subprocess
 import tempfile
-from datetime import datetime
+import time
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QFileDialog, QGraphicsView, QGraphicsScene,
-    QGraphicsPixmapItem, QMessageBox, QListWidget, QStackedWidget, QDialog, QScrollArea, QSlider, QAction
+    QGraphicsPixmapItem, QMessageBox, QListWidget, QStackedWidget, QDialog, QScrollArea, QSlider, QAction,
+    QProgressDialog
 )
 
 from PyQt5.QtGui import (
-    QPixmap, QIntValidator, QIcon, QPalette, QPainter, QPen, QImage, QClipboard, QTransform
+    QPixmap, QIntValidator, QIcon, QPalette, QPainter, QPen, QImage, QClipboard, QTransform, QImageReader,
+    QPixmapCache, QDesktopServices
+)
+from PyQt5.QtCore import (
+    Qt, QRectF, QSizeF, QPoint, QPointF, QTimer, QSize, QObject, QRunnable, QThreadPool, QProcess,
+    QUrl, pyqtSignal
 )
-from PyQt5.QtCore import Qt, QRectF, QPoint, QBuffer
 
 from PIL import Image
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.oxml.ns import qn
-import fitz  # PyMuPDF
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbo = TurboJPEG()
+except Exception:
+    _turbo = None
+
+# orjson if installed; both shims work on bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+_IS_WIN = sys.platform == "win32"
+_IS_MAC = sys.platform == "darwin"
+_IS_LINUX = sys.platform.startswith("linux")
 
 def get_appdata_folder(appname="FieldbookViewer"):
-    if sys.platform == "win32":
+    if _IS_WIN:
         # e.g., C:\Users\user\AppData\Local\FieldbookViewer
         base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
         return os.path.join(base, appname)
-    elif sys.platform == 'darwin':
+    elif _IS_MAC:
         # e.g., /Users/user/Library/Application Support/FieldbookViewer
         return os.path.join(os.path.expanduser('~/Library/Application Support/'), appname)
     else:
         # Linux/UNIX: ~/.local/share/FieldbookViewer
         return os.path.join(os.path.expanduser('~/.local/share/'), appname)
 
+def resource_path(name):
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, name)
+
+def load_stylesheet():
+    with open(resource_path("style.qss"), "r", encoding="utf-8") as f:
+        return f.read()
+
+def list_subdir_mtimes(path):
+    # {name: st_mtime_ns}; DirEntry.stat() costs one stat per folder, except on Windows
+    with os.scandir(path) as it:
+        return {e.name: e.stat().st_mtime_ns for e in it if e.is_dir()}
+
+def parse_parcel_range(name):
+    stem, _, ext = name.rpartition(".")
+    if ext.lower() not in ("jpg", "jpeg"):
+        return None
+    lo, sep, hi = stem.partition("-")
+    if not (sep and lo.isdecimal() and hi.isdecimal()):
+        return None
+    return int(lo), int(hi)
+
+def list_parcel_images(path):
+    with os.scandir(path) as it:
+        return [e.name for e in it if parse_parcel_range(e.name) and e.is_file()]
+
+def build_parcel_index(images):
+    # sorted (lo, hi, filename) ranges, their lo keys, and a running max of hi for overlapping ranges
+    ranges = sorted((*r, f) for f in images if (r := parse_parcel_range(f)))
+    max_hi, top = [], -1
+    for r in ranges:
+        top = max(top, r[1])
+        max_hi.append(top)
+    return [r[0] for r in ranges], ranges, max_hi
+
+def find_parcel_image(index, parcel):
+    lo_keys, ranges, max_hi = index
+    idx = bisect.bisect_right(lo_keys, parcel) - 1
+    while idx >= 0 and max_hi[idx] >= parcel:
+        if ranges[idx][1] >= parcel:
+            return ranges[idx][2]
+        idx -= 1
+    return None
+
+_NEPALI_DIGITS = str.maketrans('0123456789', '०१२३४५६७८९')
+
 def to_nepali_number(num):
-    num_map = str.maketrans('0123456789', '०१२३४५६७८९')
-    return str(num).translate(num_map)
+    return str(num).translate(_NEPALI_DIGITS)
 
 class Config:
     def __init__(self, path):
         self.path = path
-        self.data = {}
-        self.load()
+        self._data = None
+        self._dirty = False
+        self._valid_folders = set()
+    @property
+    def data(self):
+        if self._data is None:
+            self.load()
+        return self._data
     def load(self):
         if os.path.exists(self.path):
-            with open(self.path, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
+            with open(self.path, "rb") as f:
+                self._data = _json_loads(f.read())
         else:
-            self.data = {}
+            self._data = {}
     def save(self):
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2)
+        # write-then-rename so a crash mid-write never leaves a truncated config.json
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps(self.data))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+    def flush(self):
+        if self._dirty:
+            self.save()
     def get_folder(self, key):
         return self.data.get(key, "")
+    def is_folder_valid(self, key):
+        # only successes are remembered, so a share mounted later is still picked up
+        if key not in self._valid_folders:
+            folder = self.get_folder(key)
+            if not folder or not os.path.isdir(folder):
+                return False
+            self._valid_folders.add(key)
+        return True
+    def invalidate_folder(self, key):
+        self._valid_folders.discard(key)
     def set_folder(self, key, folder):
+        self.invalidate_folder(key)
+        if self.data.get(key) == folder:
+            return
         self.data[key] = folder
-        self.save()
+        self._dirty = True
+
+def hash_password(password, salt=None):
+    # stored as salt (16 bytes) followed by the scrypt key
+    salt = salt if salt is not None else os.urandom(16)
+    return salt + hashlib.scrypt(password.encode("utf-8"), salt=salt, n=16384, r=8, p=1)
+
+def verify_password(password, stored):
+    return hmac.compare_digest(hash_password(password, stored[:16]), stored)
 
 class UserDB:
+    PRAGMAS = ("journal_mode=WAL", "synchronous=NORMAL", "busy_timeout=5000",
+               "temp_store=MEMORY", "cache_size=-20000", "foreign_keys=ON")
     def __init__(self, db_path):
-        self.conn = sqlite3.connect(db_path)
+        # autocommit mode; transactions are opened explicitly where needed
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+        for pragma in self.PRAGMAS:
+            self.conn.execute(f"PRAGMA {pragma}")
+        self._validate_sql = "SELECT role, pwhash FROM users WHERE username=?"
         self.create_table()
     def create_table(self):
-        self.conn.execute('''CREATE TABLE IF NOT EXISTS users (
-            username TEXT PRIMARY KEY,
-            password TEXT NOT NULL,
-            role TEXT NOT NULL
-        )''')
-        cur = self.conn.cursor()
-        cur.execute("SELECT * FROM users WHERE username='admin'")
-        if not cur.fetchone():
-            self.conn.execute("INSERT INTO users VALUES (?, ?, ?)", ('admin', 'admin', 'admin'))
-            self.conn.commit()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute('''CREATE TABLE IF NOT EXISTS users (
+                username TEXT PRIMARY KEY,
+                password TEXT NOT NULL,
+                role TEXT NOT NULL,
+                pwhash BLOB
+            )''')
+            # plaintext seed; upgrade_passwords hashes it below
+            self.conn.execute("INSERT OR IGNORE INTO users (username, password, role) VALUES ('admin', 'admin', 'admin')")
+            self.upgrade_passwords()
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+    def upgrade_passwords(self):
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(users)")]
+        if "pwhash" not in columns:
+            self.conn.execute("ALTER TABLE users ADD COLUMN pwhash BLOB")
+        rows = self.conn.execute("SELECT username, password FROM users WHERE pwhash IS NULL").fetchall()
+        for username, password in rows:
+            self.conn.execute("UPDATE users SET pwhash=?, password='' WHERE username=?", (hash_password(password), username))
     def validate(self, username, password):
-        cur = self.conn.cursor()
-        cur.execute("SELECT role FROM users WHERE username=? AND password=?", (username, password))
-        row = cur.fetchone()
-        return row[0] if row else None
+        row = self.conn.execute(self._validate_sql, (username,)).fetchone()
+        if row and row[1] and verify_password(password, row[1]):
+            return row[0]
+        return None
 
 class FieldbookBottomTextDialog(QDialog):
     def __init__(self, parent=None):
@@ -107,6 +227,7 @@ class FieldbookBottomTextDialog(QDialog):
         return {k: field.text().strip() for k, field in self.inputs.items()}
 
 class FieldbookDocManager:
+    _template_cache = {}  # template path -> (mtime, raw .docx bytes), shared by both managers
     def __init__(self):
         self.doc = None
         self.section = None
@@ -114,12 +235,25 @@ class FieldbookDocManager:
         self.max_images_per_page = 3
         self.loaded_template = None
         self.footer_info = None
+        self._footer_written = None
+        self.saving = False  # set while a SaveDocTask is writing the document
+        self._revision = 0
+        self._last_render = None
     def new_from_template(self, template_path):
-        self.doc = Document(template_path)
+        from docx import Document
+        mtime = os.path.getmtime(template_path)
+        cached = self._template_cache.get(template_path)
+        if cached is None or cached[0] != mtime:
+            with open(template_path, "rb") as f:
+                cached = self._template_cache[template_path] = (mtime, f.read())
+        self.doc = Document(io.BytesIO(cached[1]))
         self.loaded_template = template_path
         self.section = self.doc.sections[0]
         self.images_on_page = 0
         self.footer_info = None
+        self._footer_written = None
+        self._revision += 1
+        self._last_render = None
     def get_footer_line(self):
         info = self.footer_info or {}
         def safe(k, dots):
@@ -131,6 +265,8 @@ class FieldbookDocManager:
             f"रसिद नं {safe('rasid_no','.....................')} बाट राजश्व लिई कम्प्युटरबाट फिल्डबुक/प्लट रजिष्टर प्रतिलिपि उतार गरि पठाइएको व्यहोरा अनुरोध छ ।"
         )
     def insert_footer_to_all_pages(self, footer_info):
+        from docx.shared import Pt
+        from docx.oxml.ns import qn
         self.footer_info = footer_info
         section = self.doc.sections[0]
         footer = section.footer
@@ -154,18 +290,27 @@ class FieldbookDocManager:
             run.font.name = "Kalimati"
             run._element.rPr.rFonts.set(qn('w:eastAsia'), 'Kalimati')
             p.alignment = aligns[i]
-        tbl = table._tbl
-        for cell in tbl.iter():
-            if cell.tag.endswith('tcBorders'):
-                cell.getparent().remove(cell)
+        # collect first: removing nodes while iter() walks the tree can skip siblings
+        for borders in table._tbl.findall('.//' + qn('w:tcBorders')):
+            borders.getparent().remove(borders)
         section.footer_distance = Pt(10)
+        self._footer_written = dict(footer_info)
     def add_image(self, pil_img, vdc, ward, sheet, parcel):
+        from docx.shared import Pt
+        from docx.oxml.ns import qn
         meta_text = (
             f"गा.वि.स: {vdc} | वडा नं: {to_nepali_number(ward)} | सिट: {to_nepali_number(sheet)} | कित्ता नं: {to_nepali_number(parcel)}"
         )
         avail_width = self.section.page_width - self.section.left_margin - self.section.right_margin
+        target_px = int(avail_width.inches * 200)
+        if pil_img.width > target_px:
+            size = (target_px, max(1, round(pil_img.height * target_px / pil_img.width)))
+            pil_img = pil_img.resize(size, Image.LANCZOS, reducing_gap=3.0)
         temp_io = io.BytesIO()
-        pil_img.save(temp_io, format="PNG")
+        if pil_img.mode in ("RGB", "L"):
+            pil_img.save(temp_io, format="JPEG", quality=85)
+        else:
+            pil_img.save(temp_io, format="PNG", compress_level=1)
         temp_io.seek(0)
         if self.images_on_page >= self.max_images_per_page:
             self.doc.add_page_break()
@@ -184,11 +329,19 @@ class FieldbookDocManager:
         last_paragraph.paragraph_format.space_after = Pt(0)
         last_paragraph.paragraph_format.keep_with_next = True
         self.images_on_page += 1
+        self._revision += 1
     def save(self, path):
-        if self.footer_info is not None:
+        if self.footer_info is not None and self.footer_info != self._footer_written:
             self.insert_footer_to_all_pages(self.footer_info)
-        if self.doc:
-            self.doc.save(path)
+        if not self.doc:
+            return
+        key = (self._revision, tuple(sorted((self._footer_written or {}).items())))
+        if self._last_render is None or self._last_render[0] != key:
+            buf = io.BytesIO()
+            self.doc.save(buf)
+            self._last_render = (key, buf.getvalue())
+        with open(path, "wb") as f:
+            f.write(self._last_render[1])
     def is_loaded(self):
         return self.doc is not None
     def close(self):
@@ -197,23 +350,68 @@ class FieldbookDocManager:
         self.loaded_template = None
         self.images_on_page = 0
         self.footer_info = None
+        self._footer_written = None
+        self._last_render = None
 
 fieldbook_doc_mgr = FieldbookDocManager()
 plotregister_doc_mgr = FieldbookDocManager()
 
+class SaveDocSignals(QObject):
+    done = pyqtSignal(str, str)  # path, error message ("" on success)
+
+class SaveDocTask(QRunnable):
+    def __init__(self, doc_mgr, path):
+        super().__init__()
+        self.doc_mgr = doc_mgr
+        self.path = path
+        self.signals = SaveDocSignals()
+    def run(self):
+        try:
+            self.doc_mgr.save(self.path)
+        except Exception as e:
+            self.signals.done.emit(self.path, str(e))
+            return
+        self.signals.done.emit(self.path, "")
+
+def save_doc_in_background(parent, doc_mgr, path, on_saved):
+    # doc_mgr.saving: the worker owns the document until done() runs
+    if doc_mgr.saving:
+        QMessageBox.information(parent, "Saving", "The document is already being saved.")
+        return
+    doc_mgr.saving = True
+    # modal at once, so Back can't close the document under the worker
+    progress = QProgressDialog("Saving document...", None, 0, 0, parent)
+    progress.setWindowTitle("Saving")
+    progress.setWindowModality(Qt.WindowModal)
+    progress.setMinimumDuration(0)
+    progress.setValue(0)
+    task = SaveDocTask(doc_mgr, path)
+    def done(path, error):
+        doc_mgr.saving = False
+        progress.close()
+        progress.deleteLater()  # close() only hides it; don't leave one child per save
+        if error:
+            QMessageBox.warning(parent, "Error", f"Could not save document: {error}")
+        else:
+            on_saved(path)
+    task.signals.done.connect(done)
+    QThreadPool.globalInstance().start(task)
+
 class PDFPreviewDialog(QDialog):
     def __init__(self, pdf_path, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Print Preview")
         layout = QVBoxLayout(self)
+        import fitz  # PyMuPDF
         self.scroll_area = QScrollArea()
         widget = QWidget()
         vbox = QVBoxLayout(widget)
         doc = fitz.open(pdf_path)
         for page_num in range(len(doc)):
             page = doc.load_page(page_num)
-            pix = page.get_pixmap(dpi=120)
-            img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGBA8888)
+            # no alpha: 3 bytes per pixel, and matches Format_RGB888
+            pix = page.get_pixmap(dpi=120, alpha=False)
+            img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
             label = QLabel()
             label.setPixmap(QPixmap.fromImage(img))
             vbox.addWidget(label)
@@ -230,64 +428,159 @@ class PDFPreviewDialog(QDialog):
         self.exit_btn.clicked.connect(self.reject)
         self.print_btn.clicked.connect(lambda: self.print_pdf(pdf_path))
     def print_pdf(self, pdf_path):
-        import platform
         try:
-            if platform.system() == "Windows":
+            if _IS_WIN:
                 os.startfile(pdf_path, "print")
-            elif platform.system() == "Darwin":
-                subprocess.run(["open", "-a", "Preview", pdf_path])
+            elif _IS_MAC:
+                start_detached("open", ["-a", "Preview", pdf_path])
             else:
-                subprocess.run(["lp", pdf_path])
+                start_detached("lp", [pdf_path])
         except Exception as e:
             QMessageBox.warning(self, "Print Error", f"Could not print: {str(e)}")
 
+FILE_DIALOG_OPTIONS = QFileDialog.DontResolveSymlinks | QFileDialog.DontUseCustomDirectoryIcons
+
+def start_detached(program, args):
+    if not QProcess.startDetached(program, args):
+        raise OSError(f"Could not start {program}.")
+
+def open_local_file(path):
+    if not QDesktopServices.openUrl(QUrl.fromLocalFile(path)):
+        raise OSError(f"No application is registered to open {os.path.basename(path)}.")
+
+def clear_owned_clipboard():
+    # clearing someone else's content still notifies every clipboard listener
+    cb = QApplication.clipboard()
+    if cb.ownsClipboard():
+        cb.clear(mode=QClipboard.Clipboard)
+    if cb.ownsSelection():
+        cb.clear(mode=QClipboard.Selection)
+
+_TEMP_DIR = "/dev/shm" if _IS_LINUX and os.access("/dev/shm", os.W_OK) else None
+
+TEMP_PREFIX = "fieldbook-"
+
+def new_temp_docx():
+    # not removed at exit: the word processor may not have opened it yet.
+    # /dev/shm is RAM, so older hand-offs are purged on every new one
+    purge_temp_docx()
+    with tempfile.NamedTemporaryFile(prefix=TEMP_PREFIX, suffix='.docx', delete=False, dir=_TEMP_DIR) as tf:
+        return tf.name
+
+def purge_temp_docx(max_age=10 * 60):
+    cutoff = time.time() - max_age
+    with os.scandir(_TEMP_DIR or tempfile.gettempdir()) as it:
+        for e in it:
+            if e.name.startswith(TEMP_PREFIX) and e.name.endswith(".docx"):
+                try:
+                    if e.stat().st_mtime < cutoff:
+                        os.remove(e.path)
+                except OSError:
+                    pass  # still held open by the word processor
+
 def convert_docx_to_pdf(docx_path, pdf_path):
-    if sys.platform.startswith('win'):
+    if _IS_WIN:
         from docx2pdf import convert
         convert(docx_path, pdf_path)
     else:
-        subprocess.run([
+        # stdout is discarded and stderr captured for the error, so neither pipe can fill up
+        result = subprocess.run([
             'libreoffice', '--headless', '--convert-to', 'pdf', docx_path, '--outdir', os.path.dirname(pdf_path)
-        ], check=True)
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise RuntimeError(f"LibreOffice failed: {result.stderr.decode(errors='replace').strip()}")
         pdf_generated = os.path.join(os.path.dirname(pdf_path), os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
         if pdf_generated != pdf_path and os.path.exists(pdf_generated):
             os.rename(pdf_generated, pdf_path)
         if not os.path.exists(pdf_path):
             raise RuntimeError("PDF was not generated. Check if LibreOffice is installed and in PATH.")
 
+def _decode_jpeg(path):
+    with open(path, "rb") as f:
+        arr = _turbo.decode(f.read(), pixel_format=TJPF_RGB)
+    h, w, _ = arr.shape
+    # copy() detaches the QImage from the numpy buffer before it is freed
+    return QImage(arr.data, w, h, 3 * w, QImage.Format_RGB888).copy()
+
+def load_pixmap(path, max_side=0):
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return QPixmap()
+    key = f"{path}:{mtime}:{max_side}"
+    pm = QPixmapCache.find(key)
+    if pm is not None and not pm.isNull():
+        return pm
+    if not max_side:
+        pm = QPixmap()
+        if _turbo is not None and path.lower().endswith((".jpg", ".jpeg")):
+            try:
+                pm = QPixmap.fromImage(_decode_jpeg(path))
+            except Exception:
+                pass
+        if pm.isNull():
+            pm = QPixmap(path)
+    else:
+        reader = QImageReader(path)
+        orig = reader.size()
+        target = orig.scaled(max_side, max_side, Qt.KeepAspectRatio)
+        if orig.isValid() and target.width() < orig.width():
+            reader.setScaledSize(target)
+        pm = QPixmap.fromImage(reader.read())
+    QPixmapCache.insert(key, pm)
+    return pm
+
 class EnhancedImageViewer(QGraphicsView):
-    def __init__(self, image_path=None):
+    def __init__(self, image_path=None, preview_only=False):
         super().__init__()
+        self.preview_only = preview_only
         self.setScene(QGraphicsScene())
         self.base_pixmap = QPixmap(image_path) if image_path else QPixmap()
         self.angle = 0
         self.pixmap_item = QGraphicsPixmapItem(self.base_pixmap)
         self.scene().addItem(self.pixmap_item)
-        self.setRenderHint(QPainter.Antialiasing)
-        self.setRenderHint(QPainter.SmoothPixmapTransform)
+        self.setRenderHint(QPainter.TextAntialiasing)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setDragMode(QGraphicsView.NoDrag)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
         self._zoom = 1.0
         self._pan = False
         self._pan_start = QPoint()
+        self._pan_delta = QPoint()
+        self._pan_flush_pending = False
+        self._current = None
+    def read_pixmap(self, path):
+        if not self.preview_only:
+            return load_pixmap(path)
+        return load_pixmap(path, max(self.viewport().width(), self.viewport().height(), 512) * 4)
     def load_image(self, path):
-        self.scene().clear()
-        self.base_pixmap = QPixmap(path)
+        try:
+            current = (path, os.path.getmtime(path))
+        except OSError:
+            current = None
+        if current is not None and current == self._current and not self.angle:
+            self.reset_view()
+            return
+        self._current = current
+        self.base_pixmap = self.read_pixmap(path)
         self.angle = 0
-        self.pixmap_item = QGraphicsPixmapItem(self.base_pixmap)
-        self.scene().addItem(self.pixmap_item)
+        self.pixmap_item.setPixmap(self.base_pixmap)
+        self.pixmap_item.setRotation(0)
+        self.pixmap_item.setTransformOriginPoint(QRectF(self.base_pixmap.rect()).center())
         self.setSceneRect(QRectF(self.base_pixmap.rect()))
-        self.resetTransform()
-        self._zoom = 1.0
+        self.reset_view()
     def set_rotation(self, angle):
         self.angle = angle
-        t = QTransform()
-        t.rotate(self.angle)
-        self.pixmap_item.setPixmap(self.base_pixmap.transformed(t, Qt.SmoothTransformation))
+        self.pixmap_item.setRotation(angle)
+    def update_smoothing(self):
+        self.setRenderHint(QPainter.SmoothPixmapTransform, self._zoom != 1.0)
     def wheelEvent(self, event):
         zoom_factor = 1.25 if event.angleDelta().y() > 0 else 0.8
         self.scale(zoom_factor, zoom_factor)
         self._zoom *= zoom_factor
+        self.update_smoothing()
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self._pan = True
@@ -296,11 +589,19 @@ class EnhancedImageViewer(QGraphicsView):
         super().mousePressEvent(event)
     def mouseMoveEvent(self, event):
         if self._pan and event.buttons() & Qt.LeftButton:
-            delta = self._pan_start - event.pos()
+            self._pan_delta += self._pan_start - event.pos()
             self._pan_start = event.pos()
-            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() + delta.x())
-            self.verticalScrollBar().setValue(self.verticalScrollBar().value() + delta.y())
+            if not self._pan_flush_pending:
+                self._pan_flush_pending = True
+                QTimer.singleShot(0, self.flush_pan)
         super().mouseMoveEvent(event)
+    def flush_pan(self):
+        self._pan_flush_pending = False
+        delta, self._pan_delta = self._pan_delta, QPoint()
+        self.viewport().setUpdatesEnabled(False)
+        self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() + delta.x())
+        self.verticalScrollBar().setValue(self.verticalScrollBar().value() + delta.y())
+        self.viewport().setUpdatesEnabled(True)
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
             self._pan = False
@@ -309,21 +610,147 @@ class EnhancedImageViewer(QGraphicsView):
     def zoom_in(self):
         self._zoom *= 1.25
         self.scale(1.25, 1.25)
+        self.update_smoothing()
     def zoom_out(self):
         self._zoom *= 0.8
         self.scale(0.8, 0.8)
+        self.update_smoothing()
     def reset_view(self):
         self.resetTransform()
         self._zoom = 1.0
+        self.update_smoothing()
+
+class PixmapCanvas(QWidget):
+    def __init__(self, image_path=None):
+        super().__init__()
+        self.base_pixmap = load_pixmap(image_path) if image_path else QPixmap()
+        self.angle = 0
+        # base_pixmap -> displayed (rotated, origin at 0,0) coordinates; applied at paint time
+        self._rotation = QTransform()
+        self._display_size = QSizeF(self.base_pixmap.size())
+        self._screen_pixmap = None
+        self.interactive = False
+        self.crop_rect = None
+        self._zoom = 1.0
+        self._offset = QPointF(0, 0)
+        self._pan = False
+        self._pan_start = QPoint()
+        self.setMinimumSize(200, 200)
+    def image_transform(self):
+        t = QTransform()
+        t.translate(self.width() / 2 + self._offset.x(), self.height() / 2 + self._offset.y())
+        t.scale(self._zoom, self._zoom)
+        t.translate(-self._display_size.width() / 2, -self._display_size.height() / 2)
+        return t
+    def map_to_image(self, pos):
+        return self.image_transform().inverted()[0].map(QPointF(pos))
+    def set_crop_rect(self, rect):
+        t = self.image_transform()
+        dirty = QRectF()
+        for r in (self.crop_rect, rect):
+            if r is not None:
+                dirty = dirty.united(t.mapRect(r))
+        self.crop_rect = rect
+        if not dirty.isNull():
+            self.update(dirty.toAlignedRect().adjusted(-2, -2, 2, 2))
+    def crop_source_rect(self):
+        # crop_rect is in displayed pixels; map it back through the rotation onto base_pixmap
+        rect = self._rotation.inverted()[0].mapRect(self.crop_rect).toAlignedRect()
+        return rect.intersected(self.base_pixmap.rect())
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        fast = self.interactive or self._pan
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, not fast and (self._zoom != 1.0 or self.angle % 90 != 0))
+        t = self.image_transform()
+        pixmap = self.paint_pixmap()
+        if pixmap is self.base_pixmap:
+            painter.setTransform(self._rotation * t)
+        else:
+            ratio = self.base_pixmap.width() / pixmap.width()
+            painter.setTransform(QTransform.fromScale(ratio, ratio) * self._rotation * t)
+        painter.drawPixmap(0, 0, pixmap)
+        if self.crop_rect is not None:
+            painter.setTransform(t)
+            pen = QPen(Qt.red, 2)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            painter.drawRect(self.crop_rect)
+        painter.end()
+    def paint_pixmap(self):
+        if self._screen_pixmap is None:
+            screen = QApplication.primaryScreen()
+            side = int(max(screen.size().width(), screen.size().height()) * screen.devicePixelRatio())
+            if max(self.base_pixmap.width(), self.base_pixmap.height()) > side:
+                self._screen_pixmap = self.base_pixmap.scaled(side, side, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            else:
+                self._screen_pixmap = self.base_pixmap
+        if self.base_pixmap.isNull():
+            return self.base_pixmap
+        if self._zoom * self.devicePixelRatioF() <= self._screen_pixmap.width() / self.base_pixmap.width():
+            return self._screen_pixmap
+        return self.base_pixmap
+    def set_pixmap(self, pixmap):
+        self.base_pixmap = pixmap
+        self._screen_pixmap = None
+        self.crop_rect = None
+        self._zoom = 1.0
+        self._offset = QPointF(0, 0)
+        self.set_rotation(0)
+    def set_interactive(self, interactive):
+        self.interactive = interactive
+        if not interactive:
+            self.update()
+    def set_rotation(self, angle):
+        self.angle = angle
+        self._rotation = QPixmap.trueMatrix(QTransform().rotate(angle), self.base_pixmap.width(), self.base_pixmap.height())
+        self._display_size = self._rotation.mapRect(QRectF(self.base_pixmap.rect())).size()
+        self.update()
+    def zoom_at(self, factor, anchor=None):
+        if anchor is not None:
+            rel = QPointF(anchor) - QPointF(self.width() / 2, self.height() / 2)
+            self._offset = (self._offset - rel) * factor + rel
+        else:
+            self._offset = self._offset * factor
+        self._zoom *= factor
+        self.update()
+    def wheelEvent(self, event):
+        zoom_factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+        self.zoom_at(zoom_factor, event.pos())
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._pan = True
+            self.setCursor(Qt.ClosedHandCursor)
+            self._pan_start = event.pos()
+        super().mousePressEvent(event)
+    def mouseMoveEvent(self, event):
+        if self._pan and event.buttons() & Qt.LeftButton:
+            self._offset += QPointF(event.pos() - self._pan_start)
+            self._pan_start = event.pos()
+            self.update()
+        super().mouseMoveEvent(event)
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._pan = False
+            self.setCursor(Qt.ArrowCursor)
+            self.update()
+        super().mouseReleaseEvent(event)
+    def zoom_in(self):
+        self.zoom_at(1.25)
+    def zoom_out(self):
+        self.zoom_at(0.8)
+    def reset_view(self):
+        self._zoom = 1.0
+        self._offset = QPointF(0, 0)
+        self.update()
 
 class ImageViewerWindow(QMainWindow):
     def __init__(self, image_path, config=None, meta=None, doc_type="fieldbook"):
         super().__init__()
         self.setWindowTitle("Image Viewer")
-        self.viewer = EnhancedImageViewer(image_path)
+        self.viewer = PixmapCanvas(image_path)
         self._crop_mode = False
-        self._last_crop = None
-        self._rect_item = None
+        self._last_crop_rect = None  # in base_pixmap pixels; cut out only when copied or inserted
+        self._start = None
         self.config = config
         self.meta = meta or {}
         self.doc_type = doc_type
@@ -334,6 +761,8 @@ class ImageViewerWindow(QMainWindow):
         self.rotation_slider.setTickPosition(QSlider.TicksBelow)
         self.rotation_slider.setTickInterval(30)
         self.rotation_slider.valueChanged.connect(self.on_slider_rotate)
+        self.rotation_slider.sliderPressed.connect(lambda: self.viewer.set_interactive(True))
+        self.rotation_slider.sliderReleased.connect(lambda: self.viewer.set_interactive(False))
         self.meta_label = QLabel(self.format_metadata())
         self.meta_label.setWordWrap(True)
         self.meta_label.setStyleSheet("font-size: 15px; padding: 7px 3px; font-weight: 600; color: #192a60")
@@ -365,7 +794,16 @@ class ImageViewerWindow(QMainWindow):
         container = QWidget()
         container.setLayout(main_layout)
         self.setCentralWidget(container)
-        self.viewer.viewport().installEventFilter(self)
+        self.viewer.installEventFilter(self)
+    def load(self, image_path, meta=None):
+        self._crop_mode = False
+        self._last_crop_rect = None
+        self._start = None
+        self.viewer.setCursor(Qt.ArrowCursor)
+        self.rotation_slider.setValue(0)
+        self.viewer.set_pixmap(load_pixmap(image_path))
+        self.meta = meta or {}
+        self.meta_label.setText(self.format_metadata())
     def on_slider_rotate(self, value):
         self.viewer.set_rotation(value)
     def format_metadata(self):
@@ -375,48 +813,52 @@ class ImageViewerWindow(QMainWindow):
         self._crop_mode = True
         self.viewer.setCursor(Qt.CrossCursor)
     def eventFilter(self, obj, event):
-        if obj is self.viewer.viewport() and self._crop_mode:
+        if obj is self.viewer and self._crop_mode:
             if event.type() == event.MouseButtonPress and event.button() == Qt.LeftButton:
-                self._start = self.viewer.mapToScene(event.pos())
-                if self._rect_item:
-                    self.viewer.scene().removeItem(self._rect_item)
-                    self._rect_item = None
+                self._start = self.viewer.map_to_image(event.pos())
+                self.viewer.set_crop_rect(None)
                 return True
-            elif event.type() == event.MouseMove and hasattr(self, "_start") and self._start:
-                end = self.viewer.mapToScene(event.pos())
-                rect = QRectF(self._start, end).normalized()
-                if self._rect_item:
-                    self.viewer.scene().removeItem(self._rect_item)
-                self._rect_item = self.viewer.scene().addRect(rect, pen=QPen(Qt.red, 2))
+            elif event.type() == event.MouseMove and self._start is not None:
+                end = self.viewer.map_to_image(event.pos())
+                self.viewer.set_crop_rect(QRectF(self._start, end).normalized())
                 return True
             elif event.type() == event.MouseButtonRelease and event.button() == Qt.LeftButton:
                 self._crop_mode = False
+                self._start = None
                 self.viewer.setCursor(Qt.ArrowCursor)
-                if self._rect_item:
-                    rect = self._rect_item.rect().toRect()
-                    cropped = self.viewer.base_pixmap.copy(rect)
-                    self._last_crop = cropped
-                    self._rect_item = None
+                if self.viewer.crop_rect is not None:
+                    self._last_crop_rect = self.viewer.crop_source_rect()
                 return True
         return super().eventFilter(obj, event)
+    def crop_image(self):
+        if self._last_crop_rect is None:
+            return None
+        cropped = self.viewer.base_pixmap.toImage().copy(self._last_crop_rect)
+        if cropped.isGrayscale() and cropped.format() != QImage.Format_Grayscale8:
+            cropped = cropped.convertToFormat(QImage.Format_Grayscale8)
+        return cropped
     def copy_crop(self):
-        if self._last_crop:
-            QApplication.clipboard().setPixmap(self._last_crop)
+        if self._last_crop_rect is not None:
+            QApplication.clipboard().setImage(self.crop_image())
             QMessageBox.information(self, "Copied", "Cropped image copied to clipboard.")
         else:
             QMessageBox.warning(self, "No Crop", "No crop selected/cropped yet.")
+    def current_image(self):
+        if self._last_crop_rect is not None:
+            return self.crop_image()
+        return self.viewer.base_pixmap.toImage()
     def get_pil_image(self):
-        if self._last_crop:
-            qimg = self._last_crop.toImage()
-        else:
-            qimg = self.viewer.base_pixmap.toImage()
+        qimg = self.current_image()
         if qimg.isNull():
             return None
-        buf = QBuffer()
-        buf.open(QBuffer.ReadWrite)
-        qimg.save(buf, "PNG")
-        pil_img = Image.open(io.BytesIO(buf.data()))
-        return pil_img
+        if qimg.format() == QImage.Format_Grayscale8:
+            mode = "L"
+        elif qimg.hasAlphaChannel():
+            mode, qimg = "RGBA", qimg.convertToFormat(QImage.Format_RGBA8888)
+        else:
+            mode, qimg = "RGB", qimg.convertToFormat(QImage.Format_RGB888)
+        data = qimg.constBits().asstring(qimg.sizeInBytes())
+        return Image.frombuffer(mode, (qimg.width(), qimg.height()), data, "raw", mode, qimg.bytesPerLine(), 1)
 
     def get_doc_mgr(self):
         return fieldbook_doc_mgr if self.doc_type == "fieldbook" else plotregister_doc_mgr
@@ -431,6 +873,9 @@ class ImageViewerWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "No image (or cropped image) to insert.")
             return
         doc_mgr = self.get_doc_mgr()
+        if doc_mgr.saving:
+            QMessageBox.information(self, "Saving", "The document is still being saved. Try again in a moment.")
+            return
         template_path = self.get_template_path()
         if not template_path or not os.path.isfile(template_path):
             QMessageBox.warning(self, "Template", f"No {self.doc_type.title()} template loaded. Use File > Load {self.doc_type.title()} Template.")
@@ -446,18 +891,11 @@ class ImageViewerWindow(QMainWindow):
             f"Image added to {self.doc_type.title()}. You can finalize and save from the button below image list when you're done."
         )
     def preview_print(self):
-        pil_img = self.get_pil_image()
-        if not pil_img:
+        qimg = self.current_image()
+        if qimg.isNull():
             QMessageBox.warning(self, "Error", "No image to preview.")
             return
-        buf = io.BytesIO()
-        pil_img.save(buf, format="PNG")
-        qt_img = QImage.fromData(buf.getvalue())
-        pixmap = QPixmap.fromImage(qt_img)
-        label = QLabel()
-        label.setPixmap(pixmap)
-        label.setScaledContents(True)
-        label.setMinimumSize(min(pixmap.width(), 800), min(pixmap.height(), 1000))
+        label = FittedPixmapLabel(QPixmap.fromImage(qimg), QSize(900, 1100))
         dlg = QDialog(self)
         dlg.setWindowTitle("Print Preview")
         layout = QVBoxLayout(dlg)
@@ -471,6 +909,96 @@ class ImageViewerWindow(QMainWindow):
         dlg.resize(900, 1100)
         dlg.exec_()
 
+class FittedPixmapLabel(QLabel):
+    def __init__(self, pixmap, initial_size):
+        super().__init__()
+        self.full_pixmap = pixmap
+        self.setAlignment(Qt.AlignCenter)
+        self.setMinimumSize(1, 1)
+        self.setPixmap(pixmap.scaled(initial_size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(100)
+        self._rescale_timer.timeout.connect(self.rescale)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._rescale_timer.start()
+    def rescale(self):
+        self.setPixmap(self.full_pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+
+class ThumbnailSignals(QObject):
+    done = pyqtSignal(str, float, QImage)
+
+class ThumbnailTask(QRunnable):
+    def __init__(self, path, known_mtime, size):
+        super().__init__()
+        self.path = path
+        self.known_mtime = known_mtime
+        self.size = size
+        self.signals = ThumbnailSignals()
+    def run(self):
+        # always reports back; a null image means nothing new to show
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+        img = QImage()
+        if mtime is not None and mtime != self.known_mtime:
+            reader = QImageReader(self.path)
+            orig = reader.size()
+            if orig.isValid():
+                reader.setScaledSize(orig.scaled(self.size, Qt.KeepAspectRatio))
+            img = reader.read()
+        self.signals.done.emit(self.path, mtime or 0.0, img)
+
+def scan_book_tree(folder):
+    tree, vdc_images, ranges, dir_mtimes, ward_images = {}, {}, {}, {}, {}
+    if not folder or not os.path.isdir(folder):
+        return tree, vdc_images, ranges, dir_mtimes, ward_images
+    dir_mtimes[folder] = os.stat(folder).st_mtime_ns
+    vdc_mtimes = list_subdir_mtimes(folder)
+    for vdc in vdc_mtimes:
+        vdc_path = os.path.join(folder, vdc)
+        dir_mtimes[vdc_path] = vdc_mtimes[vdc]
+        wards = {}
+        ward_mtimes = list_subdir_mtimes(vdc_path)
+        for ward in ward_mtimes:
+            ward_path = os.path.join(vdc_path, ward)
+            sheets = {}
+            sheet_mtimes = list_subdir_mtimes(ward_path)
+            for sheet in sheet_mtimes:
+                sheet_path = os.path.join(ward_path, sheet)
+                dir_mtimes[sheet_path] = sheet_mtimes[sheet]
+                sheets[sheet] = list_parcel_images(sheet_path)
+                ranges[sheet_path] = build_parcel_index(sheets[sheet])
+            if not sheets:
+                # a ward without sheet folders holds its images directly
+                dir_mtimes[ward_path] = ward_mtimes[ward]
+                ward_images[vdc, ward] = list_parcel_images(ward_path)
+                ranges[ward_path] = build_parcel_index(ward_images[vdc, ward])
+            wards[ward] = sheets
+        tree[vdc] = wards
+        vdc_images[vdc] = list_parcel_images(vdc_path)
+        ranges[vdc_path] = build_parcel_index(vdc_images[vdc])
+    return tree, vdc_images, ranges, dir_mtimes, ward_images
+
+class TreeScanSignals(QObject):
+    done = pyqtSignal(object, object)
+
+class TreeScanTask(QRunnable):
+    def __init__(self, folder):
+        super().__init__()
+        self.folder = folder
+        self.result = None  # set before done is emitted, for viewers that join late
+        self.signals = TreeScanSignals()
+    def run(self):
+        try:
+            result = scan_book_tree(self.folder)
+        except OSError:
+            result = {}, {}, {}, {}, {}  # still report back, so a waiting viewer leaves its loading state
+        self.result = result
+        self.signals.done.emit(self, result)
+
 class LoginWidget(QWidget):
     def __init__(self, db, on_login):
         super().__init__()
@@ -503,7 +1031,10 @@ class LoginWidget(QWidget):
             QMessageBox.warning(self, "Login Failed", "Invalid username or password.")
 
 class BookViewer(QWidget):
-    def __init__(self, config, config_key, title, doc_type, on_back=None):
+    THUMB_SIZE = QSize(64, 64)
+    THUMB_CACHE_SIZE = 256
+    THUMB_MARGIN = 8
+    def __init__(self, config, config_key, title, doc_type, on_back=None, tree_cache=None, tree_scans=None):
         super().__init__()
         self.doc_type = doc_type
         self.on_back = on_back
@@ -511,6 +1042,21 @@ class BookViewer(QWidget):
         self.config_key = config_key
         self.title = title
         self.folder = self.config.get_folder(self.config_key)
+        self._tree = {}
+        self._vdc_images = {}
+        self._ranges = {}
+        self._dir_mtimes = {}
+        self._ward_images = {}  # (vdc, ward) -> images of a ward without sheet folders
+        self._thumb_cache = collections.OrderedDict()
+        self._thumb_items = {}
+        self._thumb_done = set()
+        self._thumb_dir = None
+        self._thumb_pool = QThreadPool(self)
+        self._thumb_pool.setMaxThreadCount(1)  # one reader on the share at a time
+        self._last_viewer = None
+        self.tree_cache = tree_cache if tree_cache is not None else {}
+        self.tree_scans = tree_scans if tree_scans is not None else {}  # folder -> TreeScanTask in flight
+        self._scan_task = None
         self.init_ui()
 
     def get_doc_mgr(self):
@@ -540,6 +1086,13 @@ class BookViewer(QWidget):
         group.setContentsMargins(10, 10, 10, 10)
         left_layout.addWidget(group)
         self.image_list = QListWidget()
+        self.image_list.setIconSize(self.THUMB_SIZE)
+        self._thumb_timer = QTimer(self)
+        self._thumb_timer.setSingleShot(True)
+        self._thumb_timer.setInterval(50)
+        self._thumb_timer.timeout.connect(self.request_visible_thumbnails)
+        self.image_list.verticalScrollBar().valueChanged.connect(self._thumb_timer.start)
+        self.image_list.verticalScrollBar().rangeChanged.connect(self._thumb_timer.start)
         left_layout.addWidget(QLabel("Available Images:"))
         left_layout.addWidget(self.image_list)
         self.finalize_btn = QPushButton("Save")
@@ -558,7 +1111,7 @@ class BookViewer(QWidget):
         left_layout.insertWidget(0, self.back_btn)
         right_widget = QWidget()
         right_layout = QVBoxLayout(right_widget)
-        self.viewer = EnhancedImageViewer()
+        self.viewer = EnhancedImageViewer(preview_only=True)
         btn_zoom_in = QPushButton("Zoom In")
         btn_zoom_out = QPushButton("Zoom Out")
         btn_zoom_in.clicked.connect(self.viewer.zoom_in)
@@ -576,7 +1129,12 @@ class BookViewer(QWidget):
         self.vdc_combo.currentTextChanged.connect(self.update_wards)
         self.ward_combo.currentTextChanged.connect(self.update_sheets)
         self.sheet_combo.currentTextChanged.connect(self.update_images)
-        self.image_list.currentTextChanged.connect(self.load_selected_image)
+        self._pending_filename = None
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(150)
+        self._load_timer.timeout.connect(self.load_pending_image)
+        self.image_list.currentTextChanged.connect(self.queue_image_load)
         self.populate_vdcs()
         self.finalize_btn.clicked.connect(self.finalize_doc)
         self.print_btn.clicked.connect(self.print_doc)
@@ -619,47 +1177,109 @@ class BookViewer(QWidget):
 
 
     def handle_back(self):
-        QApplication.clipboard().clear(mode=QClipboard.Clipboard)
-        QApplication.clipboard().clear(mode=QClipboard.Selection)
         if callable(self.on_back):
             self.on_back()
 
     def set_folder(self, folder):
         self.folder = folder
         self.populate_vdcs()
-    def populate_vdcs(self):
-        self.vdc_combo.clear()
-        if not self.folder or not os.path.isdir(self.folder):
+    def rescan(self):
+        self.populate_vdcs(rescan=True)
+    def start_tree_scan(self, rescan=False):
+        task = None if rescan else self.tree_scans.get(self.folder)
+        if task is None:
+            task = self.tree_scans[self.folder] = TreeScanTask(self.folder)
+            QThreadPool.globalInstance().start(task)
+        self._scan_task = task
+        task.signals.done.connect(self.on_tree_scanned)
+        if task.result is not None:
+            self.on_tree_scanned(task, task.result)
+    def on_tree_scanned(self, task, result):
+        if task is not self._scan_task:
+            return
+        self._scan_task = None
+        if self.tree_scans.get(task.folder) is task:
+            del self.tree_scans[task.folder]
+        self.tree_cache.pop(task.folder, None)
+        self._tree, self._vdc_images, self._ranges, self._dir_mtimes, self._ward_images = result
+        self.show_vdcs()
+    def take_prefetched_tree(self):
+        cached = self.tree_cache.pop(self.folder, None)
+        if cached is None:
+            return False
+        try:
+            if os.stat(self.folder).st_mtime_ns != cached[3].get(self.folder):
+                return False
+        except OSError:
+            return False
+        self._tree, self._vdc_images, self._ranges, self._dir_mtimes, self._ward_images = cached
+        return True
+    def get_image_dir(self, vdc, ward, sheet):
+        if ward == "(No Sheet)" or sheet == "(No Sheet)" or not ward:
+            return os.path.join(self.folder, vdc)
+        if not sheet:
+            return os.path.join(self.folder, vdc, ward)
+        return os.path.join(self.folder, vdc, ward, sheet)
+    def get_images(self, vdc, ward, sheet):
+        if ward == "(No Sheet)" or sheet == "(No Sheet)" or not ward:
+            return self._vdc_images.get(vdc, [])
+        if not sheet:
+            return self._ward_images.get((vdc, ward), [])
+        return self._tree.get(vdc, {}).get(ward, {}).get(sheet, [])
+    def refresh_images(self, vdc, ward, sheet):
+        path = self.get_image_dir(vdc, ward, sheet)
+        if path not in self._ranges:
             return
-        vdcs = [d for d in os.listdir(self.folder) if os.path.isdir(os.path.join(self.folder, d))]
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        if self._dir_mtimes.get(path) == mtime:
+            return
+        self._dir_mtimes[path] = mtime
+        images = list_parcel_images(path)
+        if path == os.path.join(self.folder, vdc):
+            self._vdc_images[vdc] = images
+        elif sheet:
+            self._tree[vdc][ward][sheet] = images
+        else:
+            self._ward_images[vdc, ward] = images
+        self._ranges[path] = build_parcel_index(images)
+    def populate_vdcs(self, rescan=False):
+        if not rescan and self.take_prefetched_tree():
+            self.show_vdcs()
+            return
+        self._tree, self._vdc_images, self._ranges, self._dir_mtimes, self._ward_images = {}, {}, {}, {}, {}
+        self.vdc_combo.clear()
+        self.vdc_combo.addItem("Loading...")
+        self.search_btn.setEnabled(False)
+        self.start_tree_scan(rescan)
+    def show_vdcs(self):
+        self.vdc_combo.clear()
+        self.search_btn.setEnabled(True)
+        vdcs = list(self._tree)
         self.vdc_combo.addItems(vdcs)
         if vdcs:
             self.vdc_combo.setCurrentIndex(0)
             self.update_wards(vdcs[0])
     def update_wards(self, vdc):
         self.ward_combo.clear()
-        vdc_path = os.path.join(self.folder, vdc)
-        if not os.path.isdir(vdc_path):
+        if vdc not in self._tree:
             return
-        wards = [d for d in os.listdir(vdc_path) if os.path.isdir(os.path.join(vdc_path, d))]
+        wards = list(self._tree[vdc])
         self.ward_combo.addItems(wards)
-        direct_images = [f for f in os.listdir(vdc_path) if re.match(r"(\d+)-(\d+)\.jpe?g", f, re.IGNORECASE)]
-        if direct_images:
+        if self._vdc_images.get(vdc):
             self.ward_combo.addItem("(No Sheet)")
         if self.ward_combo.count() > 0:
             self.ward_combo.setCurrentIndex(0)
             self.update_sheets(self.ward_combo.currentText())
     def update_sheets(self, ward):
         vdc = self.vdc_combo.currentText()
-        vdc_path = os.path.join(self.folder, vdc)
         self.sheet_combo.clear()
         if ward == "(No Sheet)":
             self.update_images("(No Sheet)")
             return
-        ward_path = os.path.join(vdc_path, ward)
-        if not os.path.isdir(ward_path):
-            return
-        sheets = [d for d in os.listdir(ward_path) if os.path.isdir(os.path.join(ward_path, d))]
+        sheets = list(self._tree.get(vdc, {}).get(ward, {}))
         self.sheet_combo.addItems(sheets)
         if sheets:
             self.sheet_combo.setCurrentIndex(0)
@@ -668,20 +1288,61 @@ class BookViewer(QWidget):
         vdc = self.vdc_combo.currentText()
         ward = self.ward_combo.currentText()
         self.image_list.clear()
-        if ward == "(No Sheet)" or sheet == "(No Sheet)":
-            vdc_path = os.path.join(self.folder, vdc)
-            images = [f for f in os.listdir(vdc_path) if re.match(r"(\d+)-(\d+)\.jpe?g", f, re.IGNORECASE)]
-            self.image_list.addItems(images)
-            if images:
-                self.image_list.setCurrentRow(0)
-            return
-        sheet_path = os.path.join(self.folder, vdc, ward, sheet)
-        if not os.path.isdir(sheet_path):
-            return
-        images = [f for f in os.listdir(sheet_path) if re.match(r"(\d+)-(\d+)\.jpe?g", f, re.IGNORECASE)]
+        self.refresh_images(vdc, ward, sheet)
+        images = self.get_images(vdc, ward, sheet)
         self.image_list.addItems(images)
+        self.request_thumbnails(self.get_image_dir(vdc, ward, sheet))
         if images:
             self.image_list.setCurrentRow(0)
+    def request_thumbnails(self, image_dir):
+        # drop queued decodes for the previous listing; results still in flight only fill the cache
+        self._thumb_pool.clear()
+        self._thumb_dir = image_dir
+        self._thumb_items = {}
+        self._thumb_done = set()
+        self._thumb_timer.start()
+    def request_visible_thumbnails(self):
+        count = self.image_list.count()
+        if not count:
+            return
+        first = self.image_list.indexAt(QPoint(0, 0)).row()
+        last = self.image_list.indexAt(QPoint(0, self.image_list.viewport().height() - 1)).row()
+        first = max(first, 0) - self.THUMB_MARGIN
+        last = (last if last >= 0 else count - 1) + self.THUMB_MARGIN
+        self._thumb_pool.clear()
+        for row in range(max(first, 0), min(last + 1, count)):
+            item = self.image_list.item(row)
+            path = os.path.join(self._thumb_dir, item.text())
+            if path in self._thumb_done:
+                continue
+            cached = self._thumb_cache.get(path)
+            if path not in self._thumb_items:
+                self._thumb_items[path] = item
+                if cached:
+                    self._thumb_cache.move_to_end(path)
+                    item.setIcon(QIcon(cached[1]))
+            task = ThumbnailTask(path, cached[0] if cached else None, self.THUMB_SIZE)
+            task.signals.done.connect(self.on_thumbnail_ready)
+            self._thumb_pool.start(task)
+    def on_thumbnail_ready(self, path, mtime, img):
+        if self._thumb_items.get(path) is not None:
+            self._thumb_done.add(path)
+        if img.isNull():
+            return
+        pm = QPixmap.fromImage(img)
+        self._thumb_cache[path] = (mtime, pm)
+        self._thumb_cache.move_to_end(path)
+        while len(self._thumb_cache) > self.THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+        item = self._thumb_items.get(path)
+        if item is not None:
+            item.setIcon(QIcon(pm))
+    def queue_image_load(self, filename):
+        self._pending_filename = filename
+        self._load_timer.start()
+    def load_pending_image(self):
+        if self._pending_filename:
+            self.load_selected_image(self._pending_filename)
     def load_selected_image(self, filename):
         vdc = self.vdc_combo.currentText()
         ward = self.ward_combo.currentText()
@@ -701,35 +1362,22 @@ class BookViewer(QWidget):
         if not (vdc and parcel):
             QMessageBox.warning(self, "Error", "Please select all fields and enter a parcel number.")
             return
-        found = False
-        if ward == "(No Sheet)" or not ward:
-            vdc_path = os.path.join(self.folder, vdc)
-            for img in os.listdir(vdc_path):
-                m = re.match(r"(\d+)-(\d+)\.jpe?g", img, re.IGNORECASE)
-                if m and int(m.group(1)) <= int(parcel) <= int(m.group(2)):
-                    image_path = os.path.join(vdc_path, img)
-                    found = True
-                    viewer = ImageViewerWindow(image_path, config=self.config, meta=meta, doc_type=self.doc_type)
-                    viewer.show()
-                    viewer.raise_()
-                    viewer.activateWindow()
-                    self._last_viewer = viewer
-                    break
-        else:
-            sheet_path = os.path.join(self.folder, vdc, ward, sheet)
-            for img in os.listdir(sheet_path):
-                m = re.match(r"(\d+)-(\d+)\.jpe?g", img, re.IGNORECASE)
-                if m and int(m.group(1)) <= int(parcel) <= int(m.group(2)):
-                    image_path = os.path.join(sheet_path, img)
-                    found = True
-                    viewer = ImageViewerWindow(image_path, config=self.config, meta=meta, doc_type=self.doc_type)
-                    viewer.show()
-                    viewer.raise_()
-                    viewer.activateWindow()
-                    self._last_viewer = viewer
-                    break
-        if not found:
+        self.refresh_images(vdc, ward, sheet)
+        base_path = self.get_image_dir(vdc, ward, sheet)
+        img = None
+        if base_path in self._ranges:
+            img = find_parcel_image(self._ranges[base_path], int(parcel))
+        if img is None:
             QMessageBox.warning(self, "Not Found", "Parcel not found in this location.")
+            return
+        image_path = os.path.join(base_path, img)
+        if self._last_viewer is None:
+            self._last_viewer = ImageViewerWindow(image_path, config=self.config, meta=meta, doc_type=self.doc_type)
+        else:
+            self._last_viewer.load(image_path, meta=meta)
+        self._last_viewer.show()
+        self._last_viewer.raise_()
+        self._last_viewer.activateWindow()
 
     def finalize_doc(self):
         doc_mgr = self.get_doc_mgr()
@@ -742,14 +1390,14 @@ class BookViewer(QWidget):
             doc_mgr.footer_info = info
         else:
             return
-        save_path, _ = QFileDialog.getSaveFileName(self, f"Save {self.doc_type.title()}", "", "Word Files (*.docx)")
+        save_path, _ = QFileDialog.getSaveFileName(self, f"Save {self.doc_type.title()}", "", "Word Files (*.docx)", options=FILE_DIALOG_OPTIONS)
         if save_path:
-            doc_mgr.save(save_path)
-            QMessageBox.information(self, "Saved", f"Document saved: {save_path}\nDocument cleared.")
-            doc_mgr.close()
+            def saved(path):
+                QMessageBox.information(self, "Saved", f"Document saved: {path}\nDocument cleared.")
+                doc_mgr.close()
+            save_doc_in_background(self, doc_mgr, save_path, saved)
 
     def print_doc(self):
-        import platform
         doc_mgr = self.get_doc_mgr()
         if not doc_mgr.is_loaded():
             QMessageBox.information(self, "No Document", f"There is no active {self.doc_type.title()} to print.")
@@ -761,18 +1409,12 @@ class BookViewer(QWidget):
                 doc_mgr.footer_info = info
             else:
                 return
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tf:
-            temp_docx_path = tf.name
-            doc_mgr.save(temp_docx_path)
+        temp_docx_path = new_temp_docx()
+        save_doc_in_background(self, doc_mgr, temp_docx_path, self.open_docx)
+
+    def open_docx(self, temp_docx_path):
         try:
-            if platform.system() == "Darwin":
-                os.system(f'open "{temp_docx_path}"')
-            elif os.name == "nt":
-                os.startfile(temp_docx_path)
-            elif platform.system().startswith("linux"):
-                os.system(f'xdg-open "{temp_docx_path}"')
-            else:
-                raise OSError("Unsupported OS for auto-open")
+            open_local_file(temp_docx_path)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open DOCX for preview: {e}")
 
@@ -785,6 +1427,10 @@ class MainWindow(QMainWindow):
         self.resize(1200, 800)
         self.username = None
         self.role = None
+        self._pages = {}
+        self._tree_cache = {}
+        self._tree_scans = {}  # folder -> TreeScanTask still running
+        self._folder_icon = None
         self.stacked = QStackedWidget()
         self.setCentralWidget(self.stacked)
         self.init_menu()
@@ -830,6 +1476,12 @@ class MainWindow(QMainWindow):
         self.action_load_plotregister_template.triggered.connect(self.load_plotregister_template)
         self.menu_setup.addAction(self.action_load_plotregister_template)
 
+        self.menu_setup.addSeparator()
+
+        self.action_rescan_folder = QAction("Rescan Folder", self)
+        self.action_rescan_folder.triggered.connect(self.rescan_folder)
+        self.menu_setup.addAction(self.action_rescan_folder)
+
         # About Menu
         self.menu_about = menubar.addMenu("About")
         self.action_app_info = QAction("Application Info", self)
@@ -887,142 +1539,161 @@ class MainWindow(QMainWindow):
         dlg.exec_()
 
     def load_fieldbook_template(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "Select Fieldbook Template", "", "Word Files (*.docx)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Select Fieldbook Template", "", "Word Files (*.docx)", options=FILE_DIALOG_OPTIONS)
         if file_path:
             self.config.set_folder("fieldbook_template", file_path)
             QMessageBox.information(self, "Template Loaded", "Fieldbook template loaded successfully.")
 
     def load_plotregister_template(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "Select Plot Register Template", "", "Word Files (*.docx)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Select Plot Register Template", "", "Word Files (*.docx)", options=FILE_DIALOG_OPTIONS)
         if file_path:
             self.config.set_folder("plotregister_template", file_path)
             QMessageBox.information(self, "Template Loaded", "Plot Register template loaded successfully.")
 
     def show_login(self):
         self.menu_file.setEnabled(False)
-        while self.stacked.count() > 0:
-            widget = self.stacked.widget(0)
-            self.stacked.removeWidget(widget)
-            widget.deleteLater()
+        self.clear_pages()
         self.login_widget = LoginWidget(self.db, self.on_login)
         self.stacked.addWidget(self.login_widget)
         self.stacked.setCurrentWidget(self.login_widget)
 
+    def clear_pages(self):
+        self.stacked.setUpdatesEnabled(False)
+        for widget in [self.stacked.widget(i) for i in range(self.stacked.count())]:
+            self.stacked.removeWidget(widget)
+            widget.deleteLater()
+        self._pages = {}
+        self.stacked.setUpdatesEnabled(True)
+
     def on_login(self, username, role):
         self.username = username
         self.role = role
         self.menu_file.setEnabled(True)
+        self.prefetch_trees()
         self.show_home()
 
+    def prefetch_trees(self):
+        self._tree_cache.clear()
+        self._tree_scans.clear()
+        for key in ("fieldbook_folder", "plotregister_folder"):
+            if self.config.is_folder_valid(key):
+                folder = self.config.get_folder(key)
+                task = self._tree_scans[folder] = TreeScanTask(folder)
+                task.signals.done.connect(self.on_tree_scanned)
+                QThreadPool.globalInstance().start(task)
+
+    def on_tree_scanned(self, task, result):
+        if self._tree_scans.get(task.folder) is task:
+            del self._tree_scans[task.folder]
+            self._tree_cache[task.folder] = result
+
+    def show_page(self, key, factory):
+        page = self._pages.get(key)
+        if page is None:
+            page = self._pages[key] = factory()
+            self.stacked.addWidget(page)
+        self.stacked.setCurrentWidget(page)
+        return page
+
     def show_home(self):
+        self.show_page("home", self.build_home)
+
+    def build_home(self):
         home = QWidget()
         layout = QVBoxLayout(home)
         label = QLabel(f"Welcome, {self.username}!")
         label.setAlignment(Qt.AlignCenter)
-        label.setStyleSheet("font-size: 22px; font-weight: bold; margin: 20px;")
+        label.setObjectName("welcome")
         layout.addWidget(label)
         card_layout = QHBoxLayout()
-        btn_fieldbook = QPushButton(QIcon.fromTheme("folder"), "Fieldbook Viewer")
-        btn_fieldbook.setMinimumSize(220, 120)
-        btn_fieldbook.setStyleSheet("font-size: 20px; border-radius: 16px;")
-        btn_fieldbook.clicked.connect(self.show_fieldbook)
-        btn_plotregister = QPushButton(QIcon.fromTheme("folder"), "Plot Register Viewer")
-        btn_plotregister.setMinimumSize(220, 120)
-        btn_plotregister.setStyleSheet("font-size: 20px; border-radius: 16px;")
-        btn_plotregister.clicked.connect(self.show_plotregister)
-        card_layout.addWidget(btn_fieldbook)
-        card_layout.addWidget(btn_plotregister)
+        if self._folder_icon is None:
+            self._folder_icon = QIcon.fromTheme("folder")
+        for text, handler in (("Fieldbook Viewer", self.show_fieldbook), ("Plot Register Viewer", self.show_plotregister)):
+            btn = QPushButton(self._folder_icon, text)
+            btn.setMinimumSize(220, 120)
+            btn.setObjectName("homeCard")
+            btn.clicked.connect(handler)
+            card_layout.addWidget(btn)
         layout.addLayout(card_layout)
         layout.addStretch()
-        self.stacked.addWidget(home)
-        self.stacked.setCurrentWidget(home)
+        return home
 
     def show_fieldbook(self):
-        folder = self.config.get_folder("fieldbook_folder")
-        if not folder or not os.path.isdir(folder):
+        if not self.config.is_folder_valid("fieldbook_folder"):
             QMessageBox.information(self, "Set Folder", "Please set the Fieldbook folder from the File menu.")
             return
-        for idx in reversed(range(self.stacked.count())):
-            widget = self.stacked.widget(idx)
-            if isinstance(widget, BookViewer):
-                self.stacked.removeWidget(widget)
-                widget.deleteLater()
         def on_back():
-            QApplication.clipboard().clear(mode=QClipboard.Clipboard)
-            QApplication.clipboard().clear(mode=QClipboard.Selection)
+            if fieldbook_doc_mgr.saving:
+                QMessageBox.information(self, "Saving", "The document is still being saved. Try again in a moment.")
+                return
+            clear_owned_clipboard()
             if fieldbook_doc_mgr.is_loaded():
                 fieldbook_doc_mgr.close()
             self.show_home()
-        self.fieldbook_viewer = BookViewer(self.config, "fieldbook_folder", "Fieldbook Viewer", doc_type="fieldbook", on_back=on_back)
-        self.stacked.addWidget(self.fieldbook_viewer)
-        self.stacked.setCurrentWidget(self.fieldbook_viewer)
+        self.fieldbook_viewer = self.show_page("fieldbook", lambda: BookViewer(
+            self.config, "fieldbook_folder", "Fieldbook Viewer", doc_type="fieldbook", on_back=on_back,
+            tree_cache=self._tree_cache, tree_scans=self._tree_scans))
 
     def show_plotregister(self):
-        folder = self.config.get_folder("plotregister_folder")
-        if not folder or not os.path.isdir(folder):
+        if not self.config.is_folder_valid("plotregister_folder"):
             QMessageBox.information(self, "Set Folder", "Please set the Plot Register folder from the File menu.")
             return
-        for idx in reversed(range(self.stacked.count())):
-            widget = self.stacked.widget(idx)
-            if isinstance(widget, BookViewer):
-                self.stacked.removeWidget(widget)
-                widget.deleteLater()
         def on_back():
-            QApplication.clipboard().clear(mode=QClipboard.Clipboard)
-            QApplication.clipboard().clear(mode=QClipboard.Selection)
+            if plotregister_doc_mgr.saving:
+                QMessageBox.information(self, "Saving", "The document is still being saved. Try again in a moment.")
+                return
+            clear_owned_clipboard()
             if plotregister_doc_mgr.is_loaded():
                 plotregister_doc_mgr.close()
             self.show_home()
-        self.plotregister_viewer = BookViewer(self.config, "plotregister_folder", "Plot Register Viewer", doc_type="plotregister", on_back=on_back)
-        self.stacked.addWidget(self.plotregister_viewer)
-        self.stacked.setCurrentWidget(self.plotregister_viewer)
+        self.plotregister_viewer = self.show_page("plotregister", lambda: BookViewer(
+            self.config, "plotregister_folder", "Plot Register Viewer", doc_type="plotregister", on_back=on_back,
+            tree_cache=self._tree_cache, tree_scans=self._tree_scans))
 
     def set_fieldbook_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Fieldbook Root Directory", os.getcwd())
+        folder = QFileDialog.getExistingDirectory(self, "Select Fieldbook Root Directory", os.getcwd(),
+                                                  FILE_DIALOG_OPTIONS | QFileDialog.ShowDirsOnly)
         if folder:
             self.config.set_folder("fieldbook_folder", folder)
+            if "fieldbook" in self._pages:
+                self._pages["fieldbook"].set_folder(folder)
             QMessageBox.information(self, "Folder Set", "Fieldbook folder set successfully.")
 
     def set_plotregister_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Plot Register Root Directory", os.getcwd())
+        folder = QFileDialog.getExistingDirectory(self, "Select Plot Register Root Directory", os.getcwd(),
+                                                  FILE_DIALOG_OPTIONS | QFileDialog.ShowDirsOnly)
         if folder:
             self.config.set_folder("plotregister_folder", folder)
+            if "plotregister" in self._pages:
+                self._pages["plotregister"].set_folder(folder)
             QMessageBox.information(self, "Folder Set", "Plot Register folder set successfully.")
 
+    def rescan_folder(self):
+        widget = self.stacked.currentWidget()
+        if isinstance(widget, BookViewer):
+            self.config.invalidate_folder(widget.config_key)
+            widget.rescan()
+
     def print_fieldbook(self):
-        import platform
-        if not fieldbook_doc_mgr.is_loaded():
-            QMessageBox.information(self, "No Fieldbook", "Please finalize & save the fieldbook document first (use 'Save' in Fieldbook viewer).")
-            return
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tf:
-            temp_path = tf.name
-            fieldbook_doc_mgr.save(temp_path)
-        try:
-            if platform.system() == "Windows":
-                os.startfile(temp_path, "print")
-            elif platform.system() == "Darwin":
-                subprocess.run(["open", "-a", "Microsoft Word", temp_path])
-            else:
-                subprocess.run(["libreoffice", "--pt", temp_path])
-            QMessageBox.information(self, "Print", "Print dialog has been opened in your system's Word processor.\nPlease print from there.")
-        except Exception as e:
-            QMessageBox.warning(self, "Print Error", f"Could not open print dialog automatically.\nError: {str(e)}\nYou can open and print the saved DOCX file manually.")
+        self.print_book(fieldbook_doc_mgr, "No Fieldbook", "Please finalize & save the fieldbook document first (use 'Save' in Fieldbook viewer).")
 
     def print_plotregister(self):
-        import platform
-        if not plotregister_doc_mgr.is_loaded():
-            QMessageBox.information(self, "No Plot Register", "Please finalize & save the Plot Register document first (use 'Save' in Plot Register viewer).")
+        self.print_book(plotregister_doc_mgr, "No Plot Register", "Please finalize & save the Plot Register document first (use 'Save' in Plot Register viewer).")
+
+    def print_book(self, doc_mgr, title, not_loaded_msg):
+        if not doc_mgr.is_loaded():
+            QMessageBox.information(self, title, not_loaded_msg)
             return
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tf:
-            temp_path = tf.name
-            plotregister_doc_mgr.save(temp_path)
+        temp_path = new_temp_docx()
+        save_doc_in_background(self, doc_mgr, temp_path, self.send_to_printer)
+
+    def send_to_printer(self, temp_path):
         try:
-            if platform.system() == "Windows":
+            if _IS_WIN:
                 os.startfile(temp_path, "print")
-            elif platform.system() == "Darwin":
-                subprocess.run(["open", "-a", "Microsoft Word", temp_path])
             else:
-                subprocess.run(["libreoffice", "--pt", temp_path])
+                # no cross-platform print verb; open it in the default word processor to print from there
+                open_local_file(temp_path)
             QMessageBox.information(self, "Print", "Print dialog has been opened in your system's Word processor.\nPlease print from there.")
         except Exception as e:
             QMessageBox.warning(self, "Print Error", f"Could not open print dialog automatically.\nError: {str(e)}\nYou can open and print the saved DOCX file manually.")
@@ -1030,75 +1701,32 @@ class MainWindow(QMainWindow):
     def logout(self):
         self.username = None
         self.role = None
-        while self.stacked.count() > 0:
-            widget = self.stacked.widget(0)
-            self.stacked.removeWidget(widget)
-            widget.deleteLater()
         self.show_login()
 
+PALETTE_COLORS = (
+    (QPalette.Window, Qt.white),
+    (QPalette.WindowText, Qt.black),
+    (QPalette.Base, Qt.white),
+    (QPalette.AlternateBase, Qt.lightGray),
+    (QPalette.ToolTipBase, Qt.white),
+    (QPalette.ToolTipText, Qt.black),
+    (QPalette.Text, Qt.black),
+    (QPalette.Button, Qt.white),
+    (QPalette.ButtonText, Qt.black),
+    (QPalette.Highlight, Qt.blue),
+    (QPalette.HighlightedText, Qt.white),
+)
+
 def main():
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(256 * 1024)  # KB
     app.setStyle("Fusion")
     palette = app.palette()
-    palette.setColor(QPalette.Window, Qt.white)
-    palette.setColor(QPalette.WindowText, Qt.black)
-    palette.setColor(QPalette.Base, Qt.white)
-    palette.setColor(QPalette.AlternateBase, Qt.lightGray)
-    palette.setColor(QPalette.ToolTipBase, Qt.white)
-    palette.setColor(QPalette.ToolTipText, Qt.black)
-    palette.setColor(QPalette.Text, Qt.black)
-    palette.setColor(QPalette.Button, Qt.white)
-    palette.setColor(QPalette.ButtonText, Qt.black)
-    palette.setColor(QPalette.Highlight, Qt.blue)
-    palette.setColor(QPalette.HighlightedText, Qt.white)
+    for role, color in PALETTE_COLORS:
+        palette.setColor(role, color)
     app.setPalette(palette)
-    app.setStyleSheet("""
-        QWidget {
-            font-family: 'Segoe UI', 'Kalimati', 'Arial', sans-serif;
-            font-size: 15px;
-        }
-        QMainWindow {
-            background: #f7f7fa;
-        }
-        QGroupBox, QFrame {
-            border: 1px solid #d0d0d0;
-            border-radius: 12px;
-            background: #ffffff;
-            margin-top: 10px;
-            padding: 12px;
-        }
-        QLabel {
-            font-weight: 500;
-        }
-        QLineEdit, QComboBox, QTextEdit {
-            border: 1.5px solid #b0b0b0;
-            border-radius: 8px;
-            padding: 6px 10px;
-            background: #f9f9fc;
-        }
-        QPushButton {
-            background-color: #1976d2;
-            color: white;
-            border-radius: 8px;
-            padding: 10px 20px;
-            font-size: 16px;
-            font-weight: 600;
-            margin: 6px 0;
-        }
-        QPushButton:hover {
-            background-color: #1565c0;
-        }
-        QListWidget, QGraphicsView {
-            border: 1.5px solid #b0b0b0;
-            border-radius: 8px;
-            background: #f9f9fc;
-        }
-        QHeaderView::section {
-            background-color: #e3eafc;
-            border: none;
-            padding: 6px;
-        }
-    """)
+    app.setStyleSheet(load_stylesheet())
+    purge_temp_docx()
 
     APPDATA = get_appdata_folder()
     os.makedirs(APPDATA, exist_ok=True)  # Ensure it exists!
@@ -1107,6 +1735,8 @@ def main():
 
     db = UserDB(db_path=DB_PATH)
     config = Config(path=CONFIG_PATH)
+    app.aboutToQuit.connect(config.flush)
+    app.aboutToQuit.connect(purge_temp_docx)
 
     window = MainWindow(db, config)
     window.show()
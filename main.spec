@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('style.qss', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},